@@ -1 +1 @@
-__all__ = ["core", "adversaries", "oracles", "certificate", "cli", "plugins"]
\ No newline at end of file
+__all__ = ["core", "adversaries", "oracles", "certificate", "cli", "plugins", "fused"]
\ No newline at end of file
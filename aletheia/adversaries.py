@@ -25,6 +25,7 @@ def nearly_sorted(rng: random.Random, params: Dict[str, Any]) -> list:
 def float_dot_vectors(rng: random.Random, params: Dict[str, Any]) -> dict:
     n = rng.randint(params.get("nmin", 64), params.get("nmax", 2048))
     hi = params.get("hi", 1e16); lo = params.get("lo", 1e-16)
-    x = [(rng.random() - 0.5) * (hi if rng.random()<0.5 else lo) for _ in range(n)]
-    y = [(rng.random() - 0.5) * (hi if rng.random()<0.5 else lo) for _ in range(n)]
+    r = rng.random
+    x = [(r() - 0.5) * (hi if r()<0.5 else lo) for _ in range(n)]
+    y = [(r() - 0.5) * (hi if r()<0.5 else lo) for _ in range(n)]
     return {"x": x, "y": y}
\ No newline at end of file
@@ -1,9 +1,8 @@
 import json, hashlib
+from .certificate import sha256_hex
 
 def certificate_hash_bytes(cert_path: str) -> str:
-    with open(cert_path, "rb") as f:
-        data = f.read()
-    return "0x"+hashlib.sha256(data).hexdigest()
+    return sha256_hex(cert_path)
 
 def certificate_hash_json(cert_obj: dict) -> str:
     blob = json.dumps(cert_obj, sort_keys=True, separators=(",",":")).encode()
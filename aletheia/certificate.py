@@ -1,12 +1,13 @@
 import json, os, hashlib
-from dataclasses import asdict
-from .core import BeliefCertificate
+from .core import BeliefCertificate, certificate_dict
 
 def save_certificate(cert: BeliefCertificate, path: str) -> str:
-    data = asdict(cert)
+    data = certificate_dict(cert)
     os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
-    with open(path, "w", encoding="utf-8") as f:
-        json.dump(data, f, indent=2, sort_keys=True)
+    # Serialize up front and write once; json.dump would issue a write per token.
+    blob = json.dumps(data, indent=2, sort_keys=True).encode("utf-8")
+    with open(path, "wb") as f:
+        f.write(blob)
     return path
 
 def load_certificate(path: str) -> dict:
@@ -14,8 +15,11 @@ def load_certificate(path: str) -> dict:
         return json.load(f)
 
 def sha256_hex(path: str) -> str:
-    h = hashlib.sha256()
     with open(path, "rb") as f:
-        for chunk in iter(lambda: f.read(8192), b""):
-            h.update(chunk)
+        if hasattr(hashlib, "file_digest"):  # Python 3.11+
+            h = hashlib.file_digest(f, "sha256")
+        else:
+            h = hashlib.sha256()
+            for chunk in iter(lambda: f.read(1 << 20), b""):
+                h.update(chunk)
     return "0x" + h.hexdigest()
\ No newline at end of file
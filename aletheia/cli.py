@@ -1,7 +1,8 @@
 import argparse, platform, os
+import concurrent.futures as cf
 from typing import List
-from . import adversaries, oracles, plugins  # ensure registries are populated
-from .core import Claim, Domain, parallel_trials, make_certificate, certificate_hash, BeliefCertificate
+from . import adversaries, oracles, plugins, fused  # ensure registries are populated
+from .core import Claim, Domain, parallel_trials, make_certificate, certificate_hash, BeliefCertificate, default_max_workers
 from .certificate import save_certificate, load_certificate, sha256_hex
 
 def build_demo_claims(trials: int) -> List[Claim]:
@@ -16,20 +17,22 @@ def build_demo_claims(trials: int) -> List[Claim]:
 def cmd_compile(args):
     claims=build_demo_claims(trials=args.trials)
     results=[]
-    if args.show_bug:
-        bad=parallel_trials(claims[0], "buggy_quicksort", args.seed, max_workers=args.workers)
-        if bad.failures:
-            print(f"Bug caught at trial ~{bad.sample_failures[0].idx} - example input {bad.sample_failures[0].input_data}")
-        else:
-            print("Warning: buggy impl unexpectedly passed")
-        bad2=parallel_trials(claims[1], "dot_naive", args.seed, max_workers=args.workers)
-        if bad2.failures:
-            f=bad2.sample_failures[0]
-            print(f"Naive dot deviated - observed {f.details.get('observed')} vs baseline {f.details.get('baseline')}")
-        else:
-            print("Naive dot passed within tolerance on sampled trials")
-    res1=parallel_trials(claims[0], "quicksort3", args.seed, max_workers=args.workers)
-    res2=parallel_trials(claims[1], "dot_kahan", args.seed, max_workers=args.workers)
+    workers=args.workers if args.workers > 0 else default_max_workers()
+    with cf.ProcessPoolExecutor(max_workers=workers) as ex:  # one worker pool for every claim run
+        if args.show_bug:
+            bad=parallel_trials(claims[0], "buggy_quicksort", args.seed, max_workers=workers, executor=ex)
+            if bad.failures:
+                print(f"Bug caught at trial ~{bad.sample_failures[0].idx} - example input {bad.sample_failures[0].input_data}")
+            else:
+                print("Warning: buggy impl unexpectedly passed")
+            bad2=parallel_trials(claims[1], "dot_naive", args.seed, max_workers=workers, executor=ex)
+            if bad2.failures:
+                f=bad2.sample_failures[0]
+                print(f"Naive dot deviated - observed {f.details.get('observed')} vs baseline {f.details.get('baseline')}")
+            else:
+                print("Naive dot passed within tolerance on sampled trials")
+        res1=parallel_trials(claims[0], "quicksort3", args.seed, max_workers=workers, executor=ex)
+        res2=parallel_trials(claims[1], "dot_kahan", args.seed, max_workers=workers, executor=ex)
     results.extend([res1, res2])
     program_hash = "0x"+os.urandom(32).hex() if args.program_hash is None else args.program_hash
     cert=make_certificate(program_hash, platform.node(), results)
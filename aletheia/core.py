@@ -1,15 +1,25 @@
-import json, hashlib, time, os
-from dataclasses import dataclass, field, asdict
+import json, hashlib, time, os, pickle
+from dataclasses import dataclass, field, fields
 from typing import Callable, Dict, List, Optional, Tuple, Any
 import concurrent.futures as cf
+from collections import deque
+from contextlib import nullcontext
+from itertools import islice
 import random
 
 # ---------- Deterministic seed derivation ----------
-def derive_seed(master_seed: str, namespace: str, idx: int) -> int:
+def seed_prefix(master_seed: str, namespace: str) -> Any:
     m = hashlib.sha256()
-    m.update(master_seed.encode()); m.update(b"|"); m.update(namespace.encode()); m.update(b"|"); m.update(str(idx).encode())
+    m.update(master_seed.encode()); m.update(b"|"); m.update(namespace.encode()); m.update(b"|")
+    return m
+
+def derive_seed_from(prefix: Any, idx: int) -> int:
+    m = prefix.copy(); m.update(str(idx).encode())
     return int.from_bytes(m.digest()[:8], "big")
 
+def derive_seed(master_seed: str, namespace: str, idx: int) -> int:
+    return derive_seed_from(seed_prefix(master_seed, namespace), idx)
+
 # ---------- Epistemic IR ----------
 @dataclass
 class Domain:
@@ -70,6 +80,9 @@ def rule_of_three_upper_bound(failures: int, n: int) -> Optional[float]:
 GEN_REGISTRY: Dict[str, Callable[[random.Random, Dict[str, Any]], Any]] = {}
 ORACLE_REGISTRY: Dict[str, Callable[[Any, Any], Tuple[bool, Dict[str, Any]]]] = {}
 IMPL_REGISTRY: Dict[str, Callable[[Any, random.Random], Any]] = {}
+# (gen, impl, oracle) function objects -> fn(rng, params) -> passed. Keyed on the
+# objects, not names, so re-registering a name never reuses a stale kernel.
+FUSED_REGISTRY: Dict[Tuple[Callable, Callable, Callable], Callable[[random.Random, Dict[str, Any]], bool]] = {}
 
 def register_generator(name):
     def deco(fn): GEN_REGISTRY[name] = fn; return fn
@@ -83,49 +96,102 @@ def register_impl(name):
     def deco(fn): IMPL_REGISTRY[name] = fn; return fn
     return deco
 
+def register_fused(gen, impl, oracle):
+    def deco(fn): FUSED_REGISTRY[(gen, impl, oracle)] = fn; return fn
+    return deco
+
 # ---------- Parallel falsification ----------
-def parallel_trials(claim: Claim, impl_name: str, master_seed: str, max_workers: int=0) -> ClaimResult:
+ChunkSummary = Tuple[int, int, List[TrialResult]]  # (trials_run, failures, sample_failures)
+
+def _run_chunk(master_seed: str, claim: Claim, gen: Callable, impl: Callable, oracle: Callable,
+               fused: Optional[Callable], lo: int, hi: int) -> ChunkSummary:
+    # Usually runs in a worker process. The callables are pickled by reference,
+    # so unpickling them imports (and registers) their defining plugin modules.
+    # Passing trials are only counted; inputs are kept for sampled failures.
+    trials_run = 0
+    failures = 0
+    sample_failures: List[TrialResult] = []
+    prefix = seed_prefix(master_seed, claim.id)
+    params = claim.domain.params
+    for i in range(lo, hi):
+        trials_run += 1
+        seed = derive_seed_from(prefix, i)
+        if fused is not None and fused(random.Random(seed), params):
+            continue
+        # Unfused path; also replays fused failures to recover input/output/details.
+        rng = random.Random(seed)
+        inp = gen(rng, params)
+        out = impl(inp, rng)
+        ok, details = oracle(inp, out)
+        if not ok:
+            failures += 1
+            if len(sample_failures) < 5:
+                sample_failures.append(TrialResult(idx=i, input_data=inp, output_data=out, passed=ok, details=details))
+            if claim.stop_on_first_failure:
+                break
+    return trials_run, failures, sample_failures
+
+def _picklable(*objs: Any) -> bool:
+    try:
+        pickle.dumps(objs)
+    except (pickle.PicklingError, AttributeError, TypeError):
+        return False
+    return True
+
+def default_max_workers() -> int:
+    return min(32, (os.cpu_count() or 2))
+
+def parallel_trials(claim: Claim, impl_name: str, master_seed: str, max_workers: int=0,
+                    executor: Optional[cf.Executor]=None) -> ClaimResult:
     gen = GEN_REGISTRY[claim.adversary]
     oracle = ORACLE_REGISTRY[claim.oracle]
     impl = IMPL_REGISTRY[impl_name]
+    fused = FUSED_REGISTRY.get((gen, impl, oracle))
     if max_workers <= 0:
-        max_workers = min(32, (os.cpu_count() or 2))
+        max_workers = default_max_workers()
     failures = 0
     sample_failures: List[TrialResult] = []
     t0 = time.time()
     rng_commit = hashlib.sha256((master_seed + "|" + claim.id + "|" + impl_name).encode()).hexdigest()
     stop = claim.stop_on_first_failure
 
-    def run_one(i: int) -> TrialResult:
-        seed = derive_seed(master_seed, claim.id, i)
-        rng = random.Random(seed)
-        inp = gen(rng, claim.domain.params)
-        out = impl(inp, rng)
-        ok, details = oracle(inp, out)
-        return TrialResult(idx=i, input_data=inp, output_data=out, passed=ok, details=details)
-
-    results: List[TrialResult] = []
-    batch = 128
-    i = 0
-    with cf.ThreadPoolExecutor(max_workers=max_workers) as ex:
-        while i < claim.trials:
-            idxs = list(range(i, min(i+batch, claim.trials)))
-            futs = [ex.submit(run_one, j) for j in idxs]
-            for fut in cf.as_completed(futs):
-                tr = fut.result()
-                results.append(tr)
-                if not tr.passed:
-                    failures += 1
-                    if len(sample_failures) < 5:
-                        sample_failures.append(tr)
-                    if stop:
-                        i = claim.trials
-                        break
-            i += batch
+    # One task per contiguous chunk of trials, at most 2*max_workers in flight
+    # so workers stay fed while an early stop leaves little work to cancel.
+    # Chunks are reduced in index order so early stopping (and hence
+    # trials_run) is deterministic.
+    trials_run = 0
+    chunk = 512
+    starts = iter(range(0, claim.trials, chunk))
+    # A caller-supplied executor (sized for max_workers) is shared across
+    # calls and left running; otherwise a pool is created for this claim.
+    # Lambdas, closures and local functions (or unpicklable params) cannot reach worker processes,
+    # so those claims run chunk by chunk in this process instead.
+    in_process = not _picklable(claim, gen, impl, oracle, fused)
+    if in_process:
+        pool = nullcontext(None)
+    else:
+        pool = cf.ProcessPoolExecutor(max_workers=max_workers) if executor is None else nullcontext(executor)
+    window = 1 if in_process else 2 * max_workers
+    with pool as ex:
+        def submit(lo: int) -> cf.Future:
+            args = (master_seed, claim, gen, impl, oracle, fused, lo, min(lo+chunk, claim.trials))
+            if ex is None:
+                fut: cf.Future = cf.Future()
+                fut.set_result(_run_chunk(*args))
+                return fut
+            return ex.submit(_run_chunk, *args)
+        pending = deque(submit(lo) for lo in islice(starts, window))
+        while pending:
+            ran, failed, samples = pending.popleft().result()
+            trials_run += ran
+            failures += failed
+            sample_failures.extend(samples[:5 - len(sample_failures)])
             if failures and stop:
+                for fut in pending:
+                    fut.cancel()
                 break
+            pending.extend(submit(lo) for lo in islice(starts, 1))
 
-    trials_run = len(results)
     upper = rule_of_three_upper_bound(failures, trials_run)
     dur = time.time() - t0
     return ClaimResult(claim=claim, failures=failures, trials_run=trials_run,
@@ -164,6 +230,11 @@ def make_certificate(program_hash: str, machine: str, claim_results: List[ClaimR
         proofs=proofs_out
     )
 
+def certificate_dict(cert: BeliefCertificate) -> Dict[str, Any]:
+    # Shallow field mapping: unlike asdict() it does not deep-copy every claim,
+    # and json serializes the nested dicts/lists identically.
+    return {f.name: getattr(cert, f.name) for f in fields(cert)}
+
 def certificate_hash(cert: BeliefCertificate) -> str:
-    blob = json.dumps(asdict(cert), sort_keys=True, separators=(",",":")).encode()
+    blob = json.dumps(certificate_dict(cert), sort_keys=True, separators=(",",":")).encode()
     return "0x" + hashlib.sha256(blob).hexdigest()
\ No newline at end of file
@@ -0,0 +1,16 @@
+from typing import Any, Dict
+import random
+from .core import register_fused
+from .adversaries import duplicates_biased
+from .plugins import quicksort_3way
+from .oracles import sort_correctness_oracle
+
+# Fused kernels must call the registered gen, impl and oracle they are keyed
+# on, never restate their bodies, so a certificate always exercises the code
+# it names. Failures are replayed through the unfused path, so kernels only
+# report whether the trial passed.
+
+@register_fused(duplicates_biased, quicksort_3way, sort_correctness_oracle)
+def fused_quicksort3(rng: random.Random, params: Dict[str, Any]) -> bool:
+    inp = duplicates_biased(rng, params)
+    return sort_correctness_oracle(inp, quicksort_3way(inp, rng))[0]
@@ -12,12 +12,25 @@ def buggy_quicksort(a: List[int], rng: random.Random) -> List[int]:
 
 @register_impl("quicksort3")
 def quicksort_3way(a: List[int], rng: random.Random) -> List[int]:
-    if len(a) <= 1: return a[:]
-    pivot = a[len(a)//2]
-    lt = [x for x in a if x < pivot]
-    eq = [x for x in a if x == pivot]
-    gt = [x for x in a if x > pivot]
-    return quicksort_3way(lt, rng) + eq + quicksort_3way(gt, rng)
+    # Iterative Dijkstra 3-way partition on a copy; random pivots resist
+    # adversarial (e.g. nearly sorted) inputs.
+    b = list(a)
+    stack = [(0, len(b) - 1)]
+    while stack:
+        lo, hi = stack.pop()
+        if lo >= hi: continue
+        pivot = b[rng.randrange(lo, hi + 1)]
+        lt, i, gt = lo, lo, hi
+        while i <= gt:
+            x = b[i]
+            if x < pivot:
+                b[lt], b[i] = x, b[lt]; lt += 1; i += 1
+            elif x > pivot:
+                b[gt], b[i] = x, b[gt]; gt -= 1
+            else:
+                i += 1
+        stack.append((lo, lt - 1)); stack.append((gt + 1, hi))
+    return b
 
 @register_impl("dot_naive")
 def dot_naive(inp: dict, rng: random.Random) -> float: